@@ -1,7 +1,9 @@
 __all__ = [
     "dictionaries",
     "models",
+    "vectorizable",
 ]
 
 from py_transmuter import models
-from py_transmuter import dictionaries
\ No newline at end of file
+from py_transmuter import dictionaries
+from py_transmuter.vectorization import vectorizable
\ No newline at end of file
@@ -0,0 +1,334 @@
+from functools import partial
+from itertools import accumulate, chain, groupby
+from operator import itemgetter
+from typing import Any, Callable, Iterator, Mapping
+
+from py_transmuter.jit import is_numba_agg, reduce_groups
+from py_transmuter.parallel import map_in_processes
+from py_transmuter.plans import AggregationPlan
+from py_transmuter.self_inspector import AnyCallable
+from py_transmuter.transmuter import Transmuter
+from py_transmuter.vectorization import numpy_reduction, reduce_groups_at, to_array
+
+
+class BaseAggregator(Transmuter):
+    """
+    Groups, sorts, maps and aggregates items whose fields are read by the getters that
+    `_field_getter` builds (`itemgetter` for dictionaries, `attrgetter` for models).
+    Subclasses build each aggregated item with `build_target`.
+    """
+
+    group_by: tuple[Any, ...] | None = None
+    sort_by: tuple[Any, ...] | None = None
+
+    mappings: Mapping[Any, Any] | None = None
+    aggregations: Mapping[Any, Any] | None = None
+
+    __slots__ = ()
+
+    _class_plan: AggregationPlan | None
+    _field_getter: Callable[..., Callable[[Any], Any]]
+
+    def aggregate(self, data: list[Any], n_workers: int = 1) -> list[Any]:
+        if n_workers > 1:
+            # Grouping is a single pass, resolving the groups is what gets parallelized
+            groups = list(self.iter_groups(data))
+            return map_in_processes(self.aggregate_groups, groups, n_workers)
+
+        if not self._plan.batched_aggregations:
+            return list(self.aggregate_iter(data))
+
+        return self.aggregate_groups(list(self.iter_groups(data)))
+
+    def aggregate_groups(self, groups: list[list[Any]]) -> list[Any]:
+        batched_fields = self.resolve_batched_aggregations(groups)
+
+        return [
+            self.build_target(self.resolve_group_objects(group, group_fields))
+            for group, group_fields in zip(groups, batched_fields)
+        ]
+
+    def build_target(self, fields: dict[Any, Any]) -> Any:
+        """Builds an aggregated item from the resolved fields of its group."""
+        return fields
+
+    def aggregate_iter(self, data: list[Any]) -> Iterator[Any]:
+        for group in self.iter_groups(data):
+            yield self.build_target(self.resolve_group_objects(group))
+
+    def iter_groups(self, data: list[Any]) -> Iterator[list[Any]]:
+        if self.group_by is None:
+            yield self.sort_data(data) if self.sort_by is not None else data
+        elif self._plan.sorts_by_group:
+            # Sorting already leaves each group in a contiguous run, no need to hash them
+            for _, group in groupby(self.sort_data(data), key=self._plan.group_key):
+                yield list(group)
+        else:
+            yield from self.group_data(data)
+
+    def sort_data(self, data: list[Any]) -> list[Any]:
+        return sorted(data, key=self._plan.sort_key)
+
+    def group_data(self, data: list[Any]) -> list[list[Any]]:
+        """
+        Groups the data in a single pass and only sorts within each group. Groups are
+        returned in the order in which they would first appear if the whole data was
+        sorted, which is the order of their smallest item (ties broken by input order).
+        """
+        group_key = self._plan.group_key
+        sort_key = self._plan.sort_key
+
+        # Looking groups up through a local alias keeps the loops tight
+        if sort_key is None:
+            groups = dict()
+            get_group = groups.get
+            for item in data:
+                key = group_key(item)
+                group = get_group(key)
+                if group is None:
+                    groups[key] = [item]
+                else:
+                    group.append(item)
+
+            return list(groups.values())
+
+        keyed_groups = dict()
+        get_keyed_group = keyed_groups.get
+        for index, item in enumerate(data):
+            key = group_key(item)
+            keyed_group = get_keyed_group(key)
+            if keyed_group is None:
+                keyed_groups[key] = [(sort_key(item), index, item)]
+            else:
+                keyed_group.append((sort_key(item), index, item))
+
+        for keyed_group in keyed_groups.values():
+            keyed_group.sort(key=itemgetter(0))
+
+        return [
+            [item for _, _, item in keyed_group]
+            for keyed_group in sorted(
+                keyed_groups.values(), key=lambda keyed_group: keyed_group[0][:2]
+            )
+        ]
+
+    def resolve_group_objects(
+        self,
+        group: list[Any],
+        batched_fields: dict[Any, Any] | None = None,
+    ) -> dict[Any, Any]:
+        plan = self._plan
+        batched_fields = dict() if batched_fields is None else batched_fields
+        resolved_fields = dict()
+
+        # Fields keep the definition order, even the ones resolved for all the groups
+        for target_field_name, aggregator in plan.aggregations:
+            if target_field_name in batched_fields:
+                resolved_fields[target_field_name] = batched_fields[target_field_name]
+            else:
+                resolved_fields[target_field_name] = aggregator(group)
+
+        for target_field_name, mapper in plan.mappings:
+            resolved_fields[target_field_name] = list(map(mapper, group))
+
+        if plan.plain_mappings_getter is not None:
+            # Reads every field of an item at once, then turns the rows into columns
+            rows = list(map(plan.plain_mappings_getter, group))
+            columns = zip(*rows) if rows else [()] * len(plan.plain_mappings)
+            resolved_fields.update(zip(plan.plain_mappings, map(list, columns)))
+
+        return resolved_fields
+
+    def resolve_batched_aggregations(
+        self, groups: list[list[Any]]
+    ) -> list[dict[Any, Any]]:
+        """Resolves, for all the groups at once, the aggregations that support it."""
+        offsets = [0, *accumulate(len(group) for group in groups)]
+        resolved_fields = [dict() for _ in groups]
+
+        for target_field_name, batched in self._plan.batched_aggregations.items():
+            getter, reduction = batched
+            values = list(map(getter, chain.from_iterable(groups)))
+            for fields, value in zip(resolved_fields, reduction(values, offsets)):
+                fields[target_field_name] = value
+
+        return resolved_fields
+
+    def resolve_aggregation(
+        self,
+        aggregation: (
+            tuple[Any, Callable[[list[Any]], Any]] | Callable[[list[Any]], Any]
+        ),
+        group: list[Any],
+    ) -> list[Any]:
+        return self.compile_aggregation(aggregation, self.resolve_callable)(group)
+
+    def resolve_mapping(
+        self,
+        mapping_field: Any | tuple[Any, Callable[[Any], Any]] | Callable[[Any], Any],
+        item: Any,
+    ) -> Any:
+        return self.compile_mapping(mapping_field, self.resolve_callable)(item)
+
+    @classmethod
+    def definition_entries(cls) -> list[Any]:
+        return [
+            *(cls.group_by or ()),
+            *(cls.sort_by or ()),
+            *(cls.mappings or {}).values(),
+            *(cls.aggregations or {}).values(),
+        ]
+
+    @classmethod
+    def compile_plan(
+        cls, resolve_callable: Callable[[AnyCallable], AnyCallable]
+    ) -> AggregationPlan:
+        """Resolves the whole definition of the aggregator once, with the given callable resolver."""
+        mappings = cls.mappings or {}
+        # Many plain mappings are read together, with a single getter call per item
+        plain_mappings = ()
+        if len(mappings) > 1 and all(
+            not isinstance(mapping, tuple) and not cls.is_callable_entry(mapping)
+            for mapping in mappings.values()
+        ):
+            plain_mappings = tuple(mappings)
+
+        return AggregationPlan(
+            group_key=cls.compile_key(cls.group_by, resolve_callable),
+            sorts_by_group=(
+                cls.group_by is not None
+                and cls.sort_by is not None
+                and tuple(cls.sort_by[: len(cls.group_by)]) == tuple(cls.group_by)
+            ),
+            sort_key=cls.compile_key(cls.sort_by, resolve_callable),
+            # Tuples of pairs are iterated faster than dictionary items for each group
+            mappings=tuple(
+                (target_field_name, cls.compile_mapping(mapping, resolve_callable))
+                for target_field_name, mapping in mappings.items()
+                if target_field_name not in plain_mappings
+            ),
+            plain_mappings=plain_mappings,
+            plain_mappings_getter=(
+                cls.compile_key(tuple(mappings.values()), resolve_callable)
+                if plain_mappings
+                else None
+            ),
+            aggregations=tuple(
+                (
+                    target_field_name,
+                    cls.compile_aggregation(aggregation, resolve_callable),
+                )
+                for target_field_name, aggregation in (cls.aggregations or {}).items()
+            ),
+            batched_aggregations=cls.compile_batched_aggregations(resolve_callable),
+        )
+
+    @classmethod
+    def compile_key(
+        cls,
+        fields: tuple[Any | Callable[[Any], Any], ...] | None,
+        resolve_callable: Callable[[AnyCallable], AnyCallable],
+    ) -> Callable[[Any], Any] | None:
+        if fields is None:
+            return None
+
+        # A single getter extracts all the fields in one C call
+        if fields and not any(map(cls.is_callable_entry, fields)):
+            return cls._field_getter(*fields)
+
+        extractors = tuple(
+            (
+                resolve_callable(field)
+                if cls.is_callable_entry(field)
+                else cls._field_getter(field)
+            )
+            for field in fields
+        )
+        return lambda item: tuple(extractor(item) for extractor in extractors)
+
+    @classmethod
+    def compile_aggregation(
+        cls,
+        aggregation: (
+            tuple[Any, Callable[[list[Any]], Any]] | Callable[[list[Any]], Any]
+        ),
+        resolve_callable: Callable[[AnyCallable], AnyCallable],
+    ) -> Callable[[list[Any]], Any]:
+        if isinstance(aggregation, tuple):
+            source_field, callable = aggregation
+            getter = cls._field_getter(source_field)
+            function = resolve_callable(callable)
+            if is_numba_agg(function):
+                return lambda group: function(to_array(list(map(getter, group))))
+
+            return lambda group: function(list(map(getter, group)))
+
+        return resolve_callable(aggregation)
+
+    @classmethod
+    def compile_batched_aggregations(
+        cls, resolve_callable: Callable[[AnyCallable], AnyCallable]
+    ) -> dict[Any, tuple[Callable[[Any], Any], Callable[..., list[Any]]]]:
+        """
+        Collects the aggregations that can be resolved for all the groups at once, as
+        pairs of a source field getter and a reduction over every group's values.
+        """
+        batched_aggregations = dict()
+
+        for target_field_name, aggregation in (cls.aggregations or {}).items():
+            if not isinstance(aggregation, tuple):
+                continue
+
+            source_field, callable = aggregation
+            function = resolve_callable(callable)
+            if is_numba_agg(function):
+                batched_aggregations[target_field_name] = (
+                    cls._field_getter(source_field),
+                    partial(reduce_groups, function),
+                )
+            elif reduction := numpy_reduction(function):
+                batched_aggregations[target_field_name] = (
+                    cls._field_getter(source_field),
+                    partial(reduce_groups_at, reduction, function),
+                )
+
+        return batched_aggregations
+
+    @classmethod
+    def compile_mapping(
+        cls,
+        mapping_field: Any | tuple[Any, Callable[[Any], Any]] | Callable[[Any], Any],
+        resolve_callable: Callable[[AnyCallable], AnyCallable],
+    ) -> Callable[[Any], Any]:
+        if isinstance(mapping_field, tuple):
+            source_field, mapper_function = mapping_field
+            getter = cls._field_getter(source_field)
+            function = resolve_callable(mapper_function)
+            return lambda item: function(getter(item))
+
+        if cls.is_callable_entry(mapping_field):
+            return resolve_callable(mapping_field)
+
+        return cls._field_getter(mapping_field)
+
+    @classmethod
+    def assert_is_valid_definition(cls) -> None:
+        cls.assert_is_valid_aggregator()
+
+    @classmethod
+    def assert_is_valid_aggregator(cls) -> None:
+        if cls.aggregations is None and cls.mappings is None:
+            raise ValueError(
+                "Aggregator must have either aggregations or mappings attribute."
+            )
+
+        defined_aggregations = frozenset(cls.aggregations or ())
+        defined_mappings = frozenset(cls.mappings or ())
+
+        double_definitions = defined_mappings & defined_aggregations
+        if double_definitions:
+            fields = ", ".join(double_definitions)
+            raise ValueError(
+                f"Fields {fields} are mapped both in the mappings"
+                "and the aggregations definitions. This is not permitted."
+            )
@@ -1,13 +1,14 @@
-from collections import defaultdict
+from operator import itemgetter
 from typing import (
     Any,
     Callable,
     Mapping,
 )
-from py_transmuter.self_inspector import SelfInspector
+from py_transmuter.aggregator import BaseAggregator
+from py_transmuter.plans import AggregationPlan
 
 
-class DictionaryAggregator(SelfInspector):
+class DictionaryAggregator(BaseAggregator):
     """
     Aggregator class that transforms a list of objects of the source model
     into a list of objects of the target model.
@@ -49,8 +50,14 @@ class DictionaryAggregator(SelfInspector):
             if they are instance specific not class wide. Defaults to None.
 
     Methods:
-        aggregate(data: list[dict[Any, Any]]) -> list[dict[Any, Any]]:
+        aggregate(data: list[dict[Any, Any]], n_workers: int = 1) -> list[dict[Any, Any]]:
             Aggregates the source models into target models.
+            With `n_workers` greater than 1, the groups are resolved by that many
+            processes, which requires the aggregator to be defined at module level.
+        aggregate_iter(data: list[dict[Any, Any]]) -> Iterator[dict[Any, Any]]:
+            Same as `aggregate`, but yields each target dictionary as soon as its group
+            is resolved. When `group_by` is a prefix of `sort_by`, groups are streamed
+            from the sorted data instead of being collected all at once.
 
     Raises:
         ValueError:
@@ -79,123 +86,9 @@ class DictionaryAggregator(SelfInspector):
         | None
     ) = None
 
-    context: Mapping[str, Any] | None = None
+    context: Mapping[str, Any] | None
 
-    def __init__(self, context: Mapping[str, Any] | None = None) -> None:
-        self.assert_is_valid_aggregator()
+    __slots__ = ()
 
-        self.context = context
-
-    def aggregate(self, data: list[dict[Any, Any]]) -> list[dict[Any, Any]]:
-        if self.sort_by is not None:
-            data = self.sort_data(data)
-
-        groups = self.group_data(data) if self.group_by is not None else [data]
-
-        return [self.resolve_group_objects(group) for group in groups]
-
-    def sort_data(self, data: list[dict[Any, Any]]) -> list[dict[Any, Any]]:
-        return sorted(
-            data,
-            key=lambda item: tuple(
-                (
-                    self.resolve_callable(field)(item)
-                    if callable(field) or isinstance(field, classmethod)
-                    else item[field]
-                )
-                for field in self.sort_by
-            ),
-        )
-
-    def group_data(self, data: list[dict[Any, Any]]) -> list[list[dict[Any, Any]]]:
-        groups = defaultdict(list)
-
-        for item in data:
-            group = tuple(
-                (
-                    self.resolve_callable(field)(item)
-                    if callable(field) or isinstance(field, classmethod)
-                    else item[field]
-                )
-                for field in self.group_by
-            )
-            groups[group].append(item)
-
-        return list(groups.values())
-
-    def resolve_group_objects(self, group: list[dict[Any, Any]]) -> dict[Any, Any]:
-        aggregated_fields = (
-            {
-                target_field_name: self.resolve_aggregation(aggregation, group)
-                for target_field_name, aggregation in self.aggregations.items()
-            }
-            if self.aggregations is not None
-            else dict()
-        )
-
-        mapped_fields = (
-            {
-                target_field_name: [
-                    self.resolve_mapping(mapping, item) for item in group
-                ]
-                for target_field_name, mapping in self.mappings.items()
-            }
-            if self.mappings is not None
-            else dict()
-        )
-
-        return {**aggregated_fields, **mapped_fields}
-
-    def resolve_aggregation(
-        self,
-        aggregation: (
-            tuple[Any, Callable[[list[Any]], Any]]
-            | Callable[[list[dict[Any, Any]]], Any]
-        ),
-        group: list[dict[Any, Any]],
-    ) -> list[Any]:
-        if isinstance(aggregation, tuple):
-            source_field, callable = aggregation
-            return self.resolve_callable(callable)(
-                [item[source_field] for item in group]
-            )
-
-        return self.resolve_callable(aggregation)(group)
-
-    def resolve_mapping(
-        self,
-        mapping_field: (
-            Any | tuple[Any, Callable[[Any], Any]] | Callable[[dict[Any, Any]], Any]
-        ),
-        external_data: dict[Any, Any],
-    ) -> Any:
-        if isinstance(mapping_field, tuple):
-            source_field, mapper_function = mapping_field
-            return self.resolve_callable(mapper_function)(external_data[source_field])
-        
-        if callable(mapping_field) or isinstance(mapping_field, classmethod):
-            return self.resolve_callable(mapping_field)(external_data)
-
-        return external_data[mapping_field]
-
-    def assert_is_valid_aggregator(self) -> None:
-        if (
-            getattr(self, "aggregations", None) is None
-            and getattr(self, "mappings", None) is None
-        ):
-            raise ValueError(
-                "Aggregator must have either aggregations or mappings attribute."
-            )
-
-        defined_aggregations = (
-            set() if self.aggregations is None else set(self.aggregations.keys())
-        )
-        defined_mappings = set() if self.mappings is None else set(self.mappings.keys())
-
-        double_definitions = defined_mappings.intersection(defined_aggregations)
-        if double_definitions:
-            fields = ", ".join(double_definitions)
-            raise ValueError(
-                f"Fields {fields} are mapped both in the mappings"
-                "and the aggregations definitions. This is not permitted."
-            )
+    _class_plan: AggregationPlan | None
+    _field_getter = itemgetter
@@ -1,8 +1,13 @@
+from operator import itemgetter
 from typing import Any, Callable, Mapping
-from py_transmuter.self_inspector import SelfInspector
 
+from py_transmuter.parallel import map_in_processes
+from py_transmuter.plans import MappingPlan
+from py_transmuter.self_inspector import AnyCallable
+from py_transmuter.transmuter import Transmuter
 
-class DictionaryMapper(SelfInspector):
+
+class DictionaryMapper(Transmuter):
     """
     A generic mapper class that maps data from a source model to a target model.
 
@@ -24,9 +29,15 @@ class DictionaryMapper(SelfInspector):
         map(data: dict[Any, Any]) -> dict[Any, Any]:
             Maps the data from the source dictionary to another dictionary using the
             mapping instructions.
-        map_list(data: list[dict[Any, Any]]) -> list[dict[Any, Any]]:
+        map_list(data: list[dict[Any, Any]], n_workers: int = 1) -> list[dict[Any, Any]]:
             Maps a list of dictionaries to another list of dictionaries, one by one,
             in order, using the mapping instructions.
+            With `n_workers` greater than 1, the list is split among that many
+            processes, which requires the mapper to be defined at module level.
+        map_bytes_list(data: bytes) -> bytes:
+            Same as `map_list`, but takes and returns a JSON array of objects, parsed
+            and serialized with orjson. Non-string keys (numbers, dates, enums, etc.)
+            are serialized as strings. Requires orjson.
 
     Raises:
         ValueError:
@@ -37,22 +48,52 @@ class DictionaryMapper(SelfInspector):
         Any, Any | tuple[Any, Callable[[Any], Any]] | Callable[[dict[Any, Any]], Any]
     ]
 
-    context: Mapping[str, Any] | None = None
+    context: Mapping[str, Any] | None
+
+    __slots__ = ()
+
+    _class_plan: MappingPlan | None
 
-    def __init__(self, context: Mapping[str, Any] | None = None) -> None:
-        self.assert_is_valid_mapper()
+    def map_list(
+        self, data: list[dict[Any, Any]], n_workers: int = 1
+    ) -> list[dict[Any, Any]]:
+        if n_workers > 1:
+            return map_in_processes(self.map_list, data, n_workers)
 
-        self.context = context
+        plan = self._plan
+        if plan.resolvers:
+            return [self.map(item) for item in data]
 
-    def map_list(self, data: list[dict[Any, Any]]) -> list[dict[Any, Any]]:
-        return [self.map(item) for item in data]
+        # Only renaming keys, every item is read by a single getter call
+        plain_fields, plain_getter = plan.plain_fields, plan.plain_getter
+        return [dict(zip(plain_fields, plain_getter(item))) for item in data]
+
+    def map_bytes_list(self, data: bytes) -> bytes:
+        # orjson is only imported once it's used, so it doesn't slow down every import
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError(
+                "orjson is required for mapping JSON payloads, install it with "
+                "`pip install py-transmuter[orjson]`."
+            )
+        return orjson.dumps(
+            self.map_list(orjson.loads(data)), option=orjson.OPT_NON_STR_KEYS
+        )
 
     def map(self, data: dict[Any, Any]) -> dict[Any, Any]:
-        return {
-            target_field_name: self.resolve_field(data, source_field)
-            for target_field_name, source_field in self.mapping.items()
-        }
-    
+        plan = self._plan
+        if not plan.resolvers:
+            return dict(zip(plan.plain_fields, plan.plain_getter(data)))
+
+        # Filling a dictionary with all the fields first keeps the mapping order
+        mapped = dict.fromkeys(plan.fields)
+        mapped.update(zip(plan.plain_fields, plan.plain_getter(data)))
+        for target_field_name, resolver in plan.resolvers:
+            mapped[target_field_name] = resolver(data)
+
+        return mapped
+
     def resolve_field(
         self,
         external_data: dict[Any, Any],
@@ -60,16 +101,74 @@ class DictionaryMapper(SelfInspector):
             Any | tuple[Any, Callable[[Any], Any]] | Callable[[dict[Any, Any]], Any]
         ),
     ) -> Any:
+        return self.compile_field(mapping_field, self.resolve_callable)(external_data)
+
+    @classmethod
+    def definition_entries(cls) -> list[Any]:
+        return list(cls.mapping.values())
+
+    @classmethod
+    def compile_plan(
+        cls, resolve_callable: Callable[[AnyCallable], AnyCallable]
+    ) -> MappingPlan:
+        """Resolves every mapping once so that `map` doesn't dispatch on each call."""
+        plain_mappings = {
+            target_field_name: source_field
+            for target_field_name, source_field in cls.mapping.items()
+            if not isinstance(source_field, tuple)
+            and not cls.is_callable_entry(source_field)
+        }
+
+        return MappingPlan(
+            fields=tuple(cls.mapping.keys()),
+            plain_fields=tuple(plain_mappings.keys()),
+            plain_getter=cls.compile_plain_getter(tuple(plain_mappings.values())),
+            resolvers=tuple(
+                (target_field_name, cls.compile_field(source_field, resolve_callable))
+                for target_field_name, source_field in cls.mapping.items()
+                if target_field_name not in plain_mappings
+            ),
+        )
+
+    @staticmethod
+    def compile_plain_getter(
+        source_fields: tuple[Any, ...],
+    ) -> Callable[[dict[Any, Any]], tuple[Any, ...]]:
+        """Builds a getter that always returns a tuple with the values of the fields."""
+        if len(source_fields) == 1:
+            getter = itemgetter(source_fields[0])
+            return lambda external_data: (getter(external_data),)
+
+        if not source_fields:
+            return lambda _: ()
+
+        return itemgetter(*source_fields)
+
+    @classmethod
+    def compile_field(
+        cls,
+        mapping_field: (
+            Any | tuple[Any, Callable[[Any], Any]] | Callable[[dict[Any, Any]], Any]
+        ),
+        resolve_callable: Callable[[AnyCallable], AnyCallable],
+    ) -> Callable[[dict[Any, Any]], Any]:
         if isinstance(mapping_field, tuple):
             source_field, mapper_function = mapping_field
-            return self.resolve_callable(mapper_function)(external_data[source_field])
-        
-        if callable(mapping_field) or isinstance(mapping_field, classmethod):
-            return self.resolve_callable(mapping_field)(external_data)
-
-        return external_data[mapping_field]
-    
-    def assert_is_valid_mapper(self) -> None:
+            getter = itemgetter(source_field)
+            function = resolve_callable(mapper_function)
+            return lambda external_data: function(getter(external_data))
+
+        if cls.is_callable_entry(mapping_field):
+            return resolve_callable(mapping_field)
+
+        return itemgetter(mapping_field)
+
+    @classmethod
+    def assert_is_valid_definition(cls) -> None:
+        cls.assert_is_valid_mapper()
+
+    @classmethod
+    def assert_is_valid_mapper(cls) -> None:
         """Asserts that the mapper won't fail when trying to build an instance of the target model."""
-        if getattr(self, "mapping", None) is None:
+        if getattr(cls, "mapping", None) is None:
             raise ValueError("The mapper must define a mapping dictionary.")
\ No newline at end of file
@@ -0,0 +1,123 @@
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Callable, TypeVar
+
+AnyCallable = TypeVar("AnyCallable", bound=Callable[..., Any])
+
+_NUMBA_AGG_FLAG = "__transmuter_numba_agg__"
+_NUMERIC_FLAG = "__transmuter_numeric__"
+
+
+def numba_agg(function: AnyCallable) -> AnyCallable:
+    """
+    Compiles a reduction over a NumPy array (for example, `lambda values: values.sum()`)
+    with Numba. When used in a `(source_field, function)` aggregation, aggregators
+    reduce every group at once with a single parallel kernel instead of calling the
+    function once per group.
+    """
+    numba = _import_numba("compiled aggregations")
+    compiled = numba.njit(getattr(function, "__func__", function))
+    setattr(compiled, _NUMBA_AGG_FLAG, True)
+    return compiled
+
+
+def is_numba_agg(function: Callable[..., Any]) -> bool:
+    return getattr(function, _NUMBA_AGG_FLAG, False)
+
+
+def numeric(function: AnyCallable) -> AnyCallable:
+    """
+    Compiles a numeric field transformation (for example, a unit conversion) with
+    Numba. `ModelMapper.map_list_vectorized` reads each field transformed by a
+    `numeric` function as a NumPy array and transforms it with a single parallel
+    kernel instead of calling the function once per item.
+    """
+    numba = _import_numba("compiled transformations")
+    compiled = numba.njit(getattr(function, "__func__", function))
+    setattr(compiled, _NUMERIC_FLAG, True)
+    return compiled
+
+
+def is_numeric(function: Callable[..., Any]) -> bool:
+    return getattr(function, _NUMERIC_FLAG, False)
+
+
+def map_column(function: Callable[..., Any], values: list[Any]) -> list[Any]:
+    """
+    Applies a `numeric` transformation to every value. Numeric values are transformed
+    all at once by a parallel kernel, any other values one by one.
+    """
+    import numpy as np
+
+    array = np.asarray(values)
+    if not len(array) or array.ndim != 1 or array.dtype.kind not in "biuf":
+        return [function(value) for value in values]
+
+    # The output type is that of the transformation, which is only known once it runs
+    results = np.full(len(array), function(array[0]))
+
+    _column_kernel(function)(array, results)
+
+    return results.tolist()
+
+
+def reduce_groups(
+    function: Callable[..., Any], values: list[Any], offsets: list[int]
+) -> list[Any]:
+    """
+    Applies a `numba_agg` reduction to every group of `values`, where the group `i`
+    is the slice between `offsets[i]` and `offsets[i + 1]`.
+    """
+    if len(offsets) < 2:
+        return []
+
+    import numpy as np
+
+    values = np.asarray(values)
+    offsets = np.asarray(offsets)
+
+    # The output type is that of the reduction, which is only known once it runs
+    first_result = function(values[offsets[0] : offsets[1]])
+    results = np.full(len(offsets) - 1, first_result)
+
+    _group_reduction_kernel(function)(values, offsets, results)
+
+    return results.tolist()
+
+
+@lru_cache(maxsize=None)
+def _group_reduction_kernel(function: Callable[..., Any]) -> Callable[..., None]:
+    numba = _import_numba("compiled aggregations")
+
+    # Numba specializes (and caches) the kernel for each dtype it is called with
+    @numba.njit(parallel=True)
+    def kernel(values, offsets, results):
+        for group in numba.prange(len(offsets) - 1):
+            results[group] = function(values[offsets[group] : offsets[group + 1]])
+
+    return kernel
+
+
+@lru_cache(maxsize=None)
+def _column_kernel(function: Callable[..., Any]) -> Callable[..., None]:
+    numba = _import_numba("compiled transformations")
+
+    @numba.njit(parallel=True)
+    def kernel(values, results):
+        for index in numba.prange(len(values)):
+            results[index] = function(values[index])
+
+    return kernel
+
+
+def _import_numba(feature: str) -> ModuleType:
+    # Numba takes a long time to import, so it is only imported once it's used
+    try:
+        import numba
+    except ImportError:
+        raise ImportError(
+            f"Numba is required for {feature}, install it with "
+            "`pip install py-transmuter[numba]`."
+        )
+
+    return numba
@@ -1,4 +1,4 @@
-from collections import defaultdict
+from operator import attrgetter
 from typing import (
     Any,
     Callable,
@@ -7,12 +7,13 @@ from typing import (
     get_args,
 )
 
+from py_transmuter.aggregator import BaseAggregator
 from py_transmuter.models.types import TargetModel, SourceModel
-from py_transmuter.models.utils import get_required_fields
-from py_transmuter.self_inspector import SelfInspector
+from py_transmuter.models.utils import get_fields, get_required_fields
+from py_transmuter.plans import AggregationPlan
 
 
-class ModelAggregator(Generic[TargetModel, SourceModel], SelfInspector):
+class ModelAggregator(Generic[TargetModel, SourceModel], BaseAggregator):
     """
     Aggregator class that transforms a list of objects of the source model
     into a list of objects of the target model.
@@ -49,13 +50,24 @@ class ModelAggregator(Generic[TargetModel, SourceModel], SelfInspector):
                 - A callable that takes a list of objects of the source model as an
                     argument and returns the value of the field in the target model. The
                     callable will always receive the instances in `sort_by` order.
+        skip_validation (bool):
+            When the target model is a Pydantic `BaseModel`, build the aggregated
+            instances with `model_construct`, skipping validation. Only use it when
+            the aggregator is known to produce values of the right type. Defaults to
+            False.
         context (Mapping[str, Any] | None):
             A dictionary that allows passing specific attributes to the aggregator
             if they are instance specific not class wide. Defaults to None.
 
     Methods:
-        aggregate(data: list[SourceModel]) -> list[TargetModel]:
+        aggregate(data: list[SourceModel], n_workers: int = 1) -> list[TargetModel]:
             Aggregates the source models into target models.
+            With `n_workers` greater than 1, the groups are resolved by that many
+            processes, which requires the aggregator to be defined at module level.
+        aggregate_iter(data: list[SourceModel]) -> Iterator[TargetModel]:
+            Same as `aggregate`, but yields each target model as soon as its group is
+            resolved. When `group_by` is a prefix of `sort_by`, groups are streamed from
+            the sorted data instead of being collected all at once.
 
     Raises:
         ValueError:
@@ -82,141 +94,50 @@ class ModelAggregator(Generic[TargetModel, SourceModel], SelfInspector):
         | None
     ) = None
 
-    context: Mapping[str, Any] | None = None
+    skip_validation: bool = False
 
-    def __init__(self, context: Mapping[str, Any] | None = None) -> None:
-        self.assert_is_valid_aggregator()
+    context: Mapping[str, Any] | None
 
-        self.context = context
+    __slots__ = ()
 
-    def aggregate(self, data: list[SourceModel]) -> list[TargetModel]:
-        if self.sort_by is not None:
-            data = self.sort_data(data)
+    _class_plan: AggregationPlan | None
+    _target_cls: type[TargetModel] | None = None
+    _target_constructor: Callable[..., TargetModel] | None = None
+    _field_getter = attrgetter
 
-        groups = self.group_data(data) if self.group_by is not None else [data]
-
-        resolved_objects = [self.resolve_group_objects(group) for group in groups]
-
-        return [self.target_model()(**obj) for obj in resolved_objects]
-
-    def sort_data(self, data: list[SourceModel]) -> list[SourceModel]:
-        return sorted(
-            data,
-            key=lambda item: tuple(
-                (
-                    getattr(item, field)
-                    if isinstance(field, str)
-                    else self.resolve_callable(field)(item)
-                )
-                for field in self.sort_by
-            ),
-        )
-
-    def group_data(self, data: list[SourceModel]) -> list[list[SourceModel]]:
-        groups = defaultdict(list)
-
-        for item in data:
-            group = tuple(
-                (
-                    getattr(item, field)
-                    if isinstance(field, str)
-                    else self.resolve_callable(field)(item)
-                )
-                for field in self.group_by
-            )
-            groups[group].append(item)
-
-        return list(groups.values())
-
-    def resolve_group_objects(self, group: list[SourceModel]) -> dict[str, Any]:
-        aggregated_fields = (
-            {
-                target_field_name: self.resolve_aggregation(aggregation, group)
-                for target_field_name, aggregation in self.aggregations.items()
-            }
-            if self.aggregations is not None
-            else dict()
-        )
-
-        mapped_fields = (
-            {
-                target_field_name: [
-                    self.resolve_mapping(mapping, item) for item in group
-                ]
-                for target_field_name, mapping in self.mappings.items()
-            }
-            if self.mappings is not None
-            else dict()
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        type_args = get_args(cls.__orig_bases__[-1])
+        cls._target_cls = type_args[0] if type_args else None
+        cls._target_constructor = (
+            cls._target_cls.model_construct
+            if cls.skip_validation and hasattr(cls._target_cls, "model_construct")
+            else cls._target_cls
         )
 
-        return {**aggregated_fields, **mapped_fields}
-
-    def resolve_aggregation(
-        self,
-        aggregation: (
-            tuple[str, Callable[[list[Any]], Any]] | Callable[[list[SourceModel]], Any]
-        ),
-        group: list[SourceModel],
-    ) -> list[Any]:
-        if isinstance(aggregation, tuple):
-            source_field, callable = aggregation
-            return self.resolve_callable(callable)(
-                [getattr(item, source_field) for item in group]
-            )
-
-        return self.resolve_callable(aggregation)(group)
-
-    def resolve_mapping(
-        self,
-        mapping_field: (
-            str | tuple[str, Callable[[Any], Any]] | Callable[[SourceModel], Any]
-        ),
-        external_model: SourceModel,
-    ) -> Any:
-        if isinstance(mapping_field, str):
-            return getattr(external_model, mapping_field)
-
-        if isinstance(mapping_field, tuple):
-            source_field, callable = mapping_field
-            return self.resolve_callable(callable)(
-                getattr(external_model, source_field)
-            )
+        # The target model is needed to validate and compile the definition
+        super().__init_subclass__(**kwargs)
 
-        return self.resolve_callable(mapping_field)(external_model)
+    def build_target(self, fields: dict[str, Any]) -> TargetModel:
+        return self._target_constructor(**fields)
 
     @classmethod
     def target_model(cls) -> type[TargetModel]:
-        return get_args(cls.__orig_bases__[-1])[0]
+        return cls._target_cls
 
-    def assert_is_valid_aggregator(self) -> None:
+    @classmethod
+    def assert_is_valid_aggregator(cls) -> None:
         """Asserts that the aggregator won't fail when trying to build an instance of the target model."""
-        if (
-            getattr(self, "aggregations", None) is None
-            and getattr(self, "mappings", None) is None
-        ):
-            raise ValueError(
-                "Aggregator must have either aggregations or mappings attribute."
-            )
-
-        defined_aggregations = (
-            set() if self.aggregations is None else set(self.aggregations.keys())
-        )
-        defined_mappings = set() if self.mappings is None else set(self.mappings.keys())
+        super().assert_is_valid_aggregator()
 
-        double_definitions = defined_mappings.intersection(defined_aggregations)
-        if double_definitions:
-            fields = ", ".join(double_definitions)
-            raise ValueError(
-                f"Fields {fields} are mapped both in the mappings"
-                "and the aggregations definitions. This is not permitted."
-            )
+        all_defined_fields = frozenset(cls.aggregations or ()).union(cls.mappings or ())
 
-        all_defined_fields = defined_aggregations.union(defined_mappings)
+        target_model = cls.target_model()
+        if target_model is None:
+            raise ValueError("The aggregator must define its target and source models.")
 
-        target_model = self.target_model()
-        required_fields = set(get_required_fields(target_model))
-
-        missing_required = required_fields.difference(all_defined_fields)
+        missing_required = frozenset(get_required_fields(target_model)).difference(
+            all_defined_fields
+        )
         if missing_required:
             fields = ", ".join(missing_required)
             raise ValueError(
@@ -224,8 +145,7 @@ class ModelAggregator(Generic[TargetModel, SourceModel], SelfInspector):
                 "do not have a mapping or aggregation in the aggregator."
             )
 
-        all_fields = set(target_model.__annotations__.keys())
-        extra_fields = all_defined_fields.difference(all_fields)
+        extra_fields = all_defined_fields.difference(get_fields(target_model))
         if extra_fields:
             fields = ", ".join(extra_fields)
             raise ValueError(
@@ -1,11 +1,18 @@
+from keyword import iskeyword
+from operator import attrgetter
 from typing import Any, Callable, Generic, Mapping, get_args
 
 from py_transmuter.models.types import TargetModel, SourceModel
-from py_transmuter.models.utils import get_required_fields
-from py_transmuter.self_inspector import SelfInspector
+from py_transmuter.models.utils import get_fields, get_required_fields
+from py_transmuter.jit import is_numeric, map_column
+from py_transmuter.parallel import map_in_processes
+from py_transmuter.plans import MappingPlan
+from py_transmuter.self_inspector import AnyCallable
+from py_transmuter.transmuter import Transmuter
+from py_transmuter.vectorization import is_vectorizable, to_array, to_list
 
 
-class ModelMapper(Generic[TargetModel, SourceModel], SelfInspector):
+class ModelMapper(Generic[TargetModel, SourceModel], Transmuter):
     """
     A generic mapper class that maps data from a source model to a target model.
 
@@ -20,6 +27,10 @@ class ModelMapper(Generic[TargetModel, SourceModel], SelfInspector):
                     the value of the field in the target model.
                 - A callable that takes the source model as an argument and returns
                     the value of the field in the target model.
+        skip_validation (bool):
+            When the target model is a Pydantic `BaseModel`, build the mapped instances
+            with `model_construct`, skipping validation. Only use it when the mapping is
+            known to produce values of the right type. Defaults to False.
         context (Mapping[str, Any] | None):
             A dictionary that allows passing specific attributes to the mapper
             if they are instance specific not class wide. Defaults to None.
@@ -28,9 +39,15 @@ class ModelMapper(Generic[TargetModel, SourceModel], SelfInspector):
         map(data: SourceModel) -> TargetModel:
             Maps the data from the source model to a target model using the
             mapping dictionary.
-        map_list(data: list[SourceModel]) -> list[TargetModel]:
+        map_list(data: list[SourceModel], n_workers: int = 1) -> list[TargetModel]:
             Maps a list of source models to a list of target models, one by one,
             in order, using the mapping dictionary.
+            With `n_workers` greater than 1, the list is split among that many
+            processes, which requires the mapper to be defined at module level.
+        map_list_vectorized(data: list[SourceModel]) -> list[TargetModel]:
+            Same as `map_list`, but resolves the mapping column by column, calling
+            transformations marked with `@vectorizable` once over a NumPy array
+            with all the values of the field. Requires NumPy.
 
     Raises:
         ValueError:
@@ -44,22 +61,71 @@ class ModelMapper(Generic[TargetModel, SourceModel], SelfInspector):
         str, str | tuple[str, Callable[[Any], Any]] | Callable[[SourceModel], Any]
     ]
 
-    context: Mapping[str, Any] | None = None
+    skip_validation: bool = False
 
-    def __init__(self, context: Mapping[str, Any] | None = None) -> None:
-        self.assert_is_valid_mapper()
+    context: Mapping[str, Any] | None
 
-        self.context = context
+    __slots__ = ()
 
-    def map_list(self, data: list[SourceModel]) -> list[TargetModel]:
-        return [self.map(item) for item in data]
+    _class_plan: MappingPlan | None
+    _target_cls: type[TargetModel] | None = None
+    _target_constructor: Callable[..., TargetModel] | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        type_args = get_args(cls.__orig_bases__[-1])
+        cls._target_cls = type_args[0] if type_args else None
+        cls._target_constructor = (
+            cls._target_cls.model_construct
+            if cls.skip_validation and hasattr(cls._target_cls, "model_construct")
+            else cls._target_cls
+        )
+
+        # The target model is needed to validate and compile the definition
+        super().__init_subclass__(**kwargs)
+
+    def map_list(
+        self, data: list[SourceModel], n_workers: int = 1
+    ) -> list[TargetModel]:
+        if n_workers > 1:
+            return map_in_processes(self.map_list, data, n_workers)
+
+        plan = self._plan
+        if plan.map_function is not None:
+            return list(map(plan.map_function, data))
+        if plan.resolvers:
+            return [self.map(item) for item in data]
+
+        # Only copying attributes, every item is read by a single getter call. Kept for
+        # field names that aren't identifiers, no map function can be generated for them
+        constructor = self._target_constructor
+        plain_fields, plain_getter = plan.plain_fields, plan.plain_getter
+        return [
+            constructor(**dict(zip(plain_fields, plain_getter(item)))) for item in data
+        ]
+
+    def map_list_vectorized(self, data: list[SourceModel]) -> list[TargetModel]:
+        field_names = tuple(self.mapping.keys())
+        columns = [
+            self.resolve_column(data, mapping_field)
+            for mapping_field in self.mapping.values()
+        ]
+        # Without columns (every target field has a default) there is still a row per item
+        rows = zip(*columns) if columns else [()] * len(data)
+        return [
+            self._target_constructor(**dict(zip(field_names, values)))
+            for values in rows
+        ]
 
     def map(self, data: SourceModel) -> TargetModel:
-        resolved_map = {
-            target_field_name: self.resolve_field(data, source_field)
-            for target_field_name, source_field in self.mapping.items()
-        }
-        return self.target_model()(**resolved_map)
+        plan = self._plan
+        if plan.map_function is not None:
+            return plan.map_function(data)
+
+        mapped = dict(zip(plan.plain_fields, plan.plain_getter(data)))
+        for target_field_name, resolver in plan.resolvers:
+            mapped[target_field_name] = resolver(data)
+
+        return self._target_constructor(**mapped)
 
     def resolve_field(
         self,
@@ -68,32 +134,168 @@ class ModelMapper(Generic[TargetModel, SourceModel], SelfInspector):
             str | tuple[str, Callable[[Any], Any]] | Callable[[SourceModel], Any]
         ),
     ) -> Any:
-        if isinstance(mapping_field, str):
-            return getattr(external_model, mapping_field)
+        return self.compile_field(mapping_field, self.resolve_callable)(external_model)
 
+    def resolve_column(
+        self,
+        external_models: list[SourceModel],
+        mapping_field: (
+            str | tuple[str, Callable[[Any], Any]] | Callable[[SourceModel], Any]
+        ),
+    ) -> list[Any]:
         if isinstance(mapping_field, tuple):
             source_field, callable = mapping_field
-            return self.resolve_callable(callable)(
-                getattr(external_model, source_field)
+            function = self.resolve_callable(callable)
+            if is_vectorizable(function):
+                column = list(map(attrgetter(source_field), external_models))
+                return to_list(function(to_array(column)))
+            if is_numeric(function):
+                column = list(map(attrgetter(source_field), external_models))
+                return map_column(function, column)
+
+        return list(
+            map(
+                self.compile_field(mapping_field, self.resolve_callable),
+                external_models,
             )
+        )
+
+    @classmethod
+    def compile_class_plan(cls) -> MappingPlan:
+        """
+        Compiles the plan shared by the whole class, with a generated map function.
+        Plans compiled for each instance don't generate one, since compiling it on
+        every `__init__` costs more than it saves.
+        """
+        return cls.compile_plan(cls.resolve_class_callable, generate_map_function=True)
+
+    @classmethod
+    def definition_entries(cls) -> list[Any]:
+        return list(cls.mapping.values())
+
+    @classmethod
+    def compile_plan(
+        cls,
+        resolve_callable: Callable[[AnyCallable], AnyCallable],
+        generate_map_function: bool = False,
+    ) -> MappingPlan:
+        """Resolves every mapping once so that `map` doesn't dispatch on each call."""
+        plain_mappings = {
+            target_field_name: source_field
+            for target_field_name, source_field in cls.mapping.items()
+            if isinstance(source_field, str)
+        }
 
-        return self.resolve_callable(mapping_field)(external_model)
+        return MappingPlan(
+            fields=tuple(cls.mapping.keys()),
+            plain_fields=tuple(plain_mappings.keys()),
+            plain_getter=cls.compile_plain_getter(tuple(plain_mappings.values())),
+            resolvers=tuple(
+                (target_field_name, cls.compile_field(source_field, resolve_callable))
+                for target_field_name, source_field in cls.mapping.items()
+                if target_field_name not in plain_mappings
+            ),
+            map_function=(
+                cls.compile_map_function(resolve_callable)
+                if generate_map_function
+                else None
+            ),
+        )
+
+    @classmethod
+    def compile_map_function(
+        cls, resolve_callable: Callable[[AnyCallable], AnyCallable]
+    ) -> Callable[[SourceModel], TargetModel] | None:
+        """
+        Generates the source of a function that builds the target model with every
+        field access and call of the mapping written inline, and compiles it. Returns
+        None if a field name can't be written as Python code.
+        """
+        namespace = {"_target": cls._target_constructor}
+        arguments = list()
+
+        for index, (target_field_name, mapping_field) in enumerate(cls.mapping.items()):
+            if isinstance(mapping_field, str):
+                source_field, function = mapping_field, None
+            elif isinstance(mapping_field, tuple):
+                source_field, callable = mapping_field
+                function = resolve_callable(callable)
+            else:
+                source_field, function = None, resolve_callable(mapping_field)
+
+            if not _is_name(target_field_name) or (
+                source_field is not None
+                and not all(map(_is_name, source_field.split(".")))
+            ):
+                return None
+
+            value = "data" if source_field is None else f"data.{source_field}"
+            if function is not None:
+                namespace[f"_function_{index}"] = function
+                value = f"_function_{index}({value})"
+
+            arguments.append(f"{target_field_name}={value}")
+
+        source = f"def map_model(data):\n    return _target({', '.join(arguments)})\n"
+        exec(compile(source, f"<{cls.__name__} map>", "exec"), namespace)
+        return namespace["map_model"]
+
+    @staticmethod
+    def compile_plain_getter(
+        source_fields: tuple[str, ...],
+    ) -> Callable[[SourceModel], tuple[Any, ...]]:
+        """Builds a getter that always returns a tuple with the values of the fields."""
+        if len(source_fields) == 1:
+            getter = attrgetter(source_fields[0])
+            return lambda external_model: (getter(external_model),)
+
+        if not source_fields:
+            return lambda _: ()
+
+        return attrgetter(*source_fields)
+
+    @classmethod
+    def compile_field(
+        cls,
+        mapping_field: (
+            str | tuple[str, Callable[[Any], Any]] | Callable[[SourceModel], Any]
+        ),
+        resolve_callable: Callable[[AnyCallable], AnyCallable],
+    ) -> Callable[[SourceModel], Any]:
+        if isinstance(mapping_field, str):
+            return attrgetter(mapping_field)
+
+        if isinstance(mapping_field, tuple):
+            source_field, callable = mapping_field
+            getter = attrgetter(source_field)
+            function = resolve_callable(callable)
+            return lambda external_model: function(getter(external_model))
+
+        return resolve_callable(mapping_field)
 
     @classmethod
     def target_model(cls) -> type[TargetModel]:
-        return get_args(cls.__orig_bases__[-1])[0]
+        return cls._target_cls
 
-    def assert_is_valid_mapper(self) -> None:
+    @classmethod
+    def assert_is_valid_definition(cls) -> None:
+        cls.assert_is_valid_mapper()
+
+    @classmethod
+    def assert_is_valid_mapper(cls) -> None:
         """Asserts that the mapper won't fail when trying to build an instance of the target model."""
-        if getattr(self, "mapping", None) is None:
+        if getattr(cls, "mapping", None) is None:
             raise ValueError("The mapper must define a mapping dictionary.")
 
-        target_model = self.target_model()
+        target_model = cls.target_model()
+        if target_model is None:
+            raise ValueError("The mapper must define its target and source models.")
 
-        required_fields = set(get_required_fields(target_model))
-        defined_mappings = set(self.mapping.keys())
+        defined_mappings = frozenset(cls.mapping)
 
-        missing_required = required_fields.difference(defined_mappings)
+        missing_required = frozenset(get_required_fields(target_model)).difference(
+            defined_mappings
+        )
         if missing_required:
             fields = ", ".join(missing_required)
             raise ValueError(
@@ -101,11 +303,14 @@ class ModelMapper(Generic[TargetModel, SourceModel], SelfInspector):
                 "do not have a mapping in the mapper."
             )
 
-        all_fields = set(target_model.__annotations__.keys())
-        extra_fields = defined_mappings.difference(all_fields)
+        extra_fields = defined_mappings.difference(get_fields(target_model))
         if extra_fields:
             fields = ", ".join(extra_fields)
             raise ValueError(
                 f"Fields {fields} in the mapper do not exist "
                 f"in target model {target_model.__name__}."
             )
+
+
+def _is_name(name: Any) -> bool:
+    return isinstance(name, str) and name.isidentifier() and not iskeyword(name)
@@ -1,27 +1,44 @@
-import inspect
+from functools import cache
 from types import UnionType
-from typing import Optional, Union, get_type_hints
+from typing import Any, Mapping, Union, get_args, get_origin, get_type_hints
 
 from py_transmuter.models.types import SupportsTypeHints
 
 
-def get_required_fields(model_cls: type[SupportsTypeHints]) -> list[str]:
-    required_fields = list()
-
-    type_hints = get_type_hints(model_cls)
-    for field, field_type in type_hints.items():
-        # For Python 3.10 and later: Check if field_type is UnionType and contains None
-        if isinstance(field_type, UnionType):
-            if type(None) not in field_type.__args__:
-                required_fields.append(field)
-        # For earlier versions: Check if field_type is a Union and if NoneType is one of the Union types
-        elif getattr(field_type, "__origin__", None) is Union:
-            if type(None) not in getattr(field_type, "__args__", ()):
-                required_fields.append(field)
-        # Check if the type hint is explicitly Optional but not a Union (for completeness)
-        elif not (
-            inspect.isclass(field_type) and issubclass(field_type, type(Optional))
-        ):
-            required_fields.append(field)
-
-    return required_fields
+def get_pydantic_fields(model_cls: type[SupportsTypeHints]) -> Mapping[str, Any] | None:
+    """Returns the Pydantic field information of the class, if it has any."""
+    return getattr(model_cls, "model_fields", None) or getattr(
+        model_cls, "__pydantic_fields__", None
+    )
+
+
+@cache
+def get_fields(model_cls: type[SupportsTypeHints]) -> tuple[str, ...]:
+    pydantic_fields = get_pydantic_fields(model_cls)
+    if pydantic_fields is not None:
+        return tuple(pydantic_fields)
+
+    return tuple(model_cls.__annotations__)
+
+
+@cache
+def get_required_fields(model_cls: type[SupportsTypeHints]) -> tuple[str, ...]:
+    # Pydantic models and dataclasses already know which of their fields are required
+    pydantic_fields = get_pydantic_fields(model_cls)
+    if pydantic_fields is not None:
+        return tuple(
+            field for field, info in pydantic_fields.items() if info.is_required()
+        )
+
+    # Optional fields are unions (`X | None`, `Optional[X]`) with None in their args,
+    # other generics with None in their args (`Callable[[X], None]`) are required
+    return tuple(
+        field
+        for field, field_type in get_type_hints(model_cls).items()
+        if not _is_optional(field_type)
+    )
+
+
+def _is_optional(field_type: Any) -> bool:
+    is_union = get_origin(field_type) in (Union, UnionType)
+    return is_union and type(None) in get_args(field_type)
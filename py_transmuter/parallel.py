@@ -0,0 +1,33 @@
+from itertools import chain
+from math import ceil
+from typing import Any, Callable
+
+
+def map_in_processes(
+    function: Callable[[list[Any]], list[Any]], items: list[Any], n_workers: int
+) -> list[Any]:
+    """
+    Splits `items` in `n_workers` contiguous chunks, calls `function` with each of
+    them in a pool of processes and concatenates the results in order. Both the
+    function and the items must be picklable, which means that mappers and aggregators
+    (and their models) must be defined at module level. Workers import the main module
+    again, so scripts have to call this behind an `if __name__ == "__main__":` guard.
+    """
+    if not items:
+        return []
+
+    # The process pool takes a long time to import, so it is only imported once it's used
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_all_start_methods, get_context
+
+    chunk_size = ceil(len(items) / n_workers)
+    chunks = [
+        items[start : start + chunk_size] for start in range(0, len(items), chunk_size)
+    ]
+
+    # Forking a process that runs threads (like Numba's parallel kernels) can deadlock
+    start_method = "forkserver" if "forkserver" in get_all_start_methods() else "spawn"
+    with ProcessPoolExecutor(
+        max_workers=n_workers, mp_context=get_context(start_method)
+    ) as executor:
+        return list(chain.from_iterable(executor.map(function, chunks)))
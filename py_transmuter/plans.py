@@ -0,0 +1,33 @@
+from typing import Any, Callable, Mapping, NamedTuple
+
+
+class AggregationPlan(NamedTuple):
+    """
+    The definition of an aggregator with all of its fields and callables already
+    resolved, so that aggregating doesn't need to inspect the definition again.
+    """
+
+    group_key: Callable[[Any], Any] | None
+    sorts_by_group: bool
+    sort_key: Callable[[Any], Any] | None
+    mappings: tuple[tuple[Any, Callable[[Any], Any]], ...]
+    plain_mappings: tuple[Any, ...]
+    plain_mappings_getter: Callable[[Any], tuple[Any, ...]] | None
+    aggregations: tuple[tuple[Any, Callable[[list[Any]], Any]], ...]
+    batched_aggregations: Mapping[
+        Any, tuple[Callable[[Any], Any], Callable[[list[Any], list[int]], list[Any]]]
+    ]
+
+
+class MappingPlan(NamedTuple):
+    """
+    The definition of a mapper with all of its fields and callables already resolved.
+    Plain fields are read all at once by a single getter, the rest of the fields have
+    their own resolver.
+    """
+
+    fields: tuple[Any, ...]
+    plain_fields: tuple[Any, ...]
+    plain_getter: Callable[[Any], tuple[Any, ...]]
+    resolvers: tuple[tuple[Any, Callable[[Any], Any]], ...]
+    map_function: Callable[[Any], Any] | None = None
@@ -1,9 +1,12 @@
-from functools import partial
-import inspect
-from typing import Any, Callable
+from types import FunctionType, MethodType
+from typing import Any, Callable, Iterable, Mapping
 
 AnyCallable = Callable[..., Any]
 
+INSTANCE_METHOD = "instance"
+CLASS_METHOD = "class"
+STATIC_METHOD = "static"
+
 
 class SelfInspector:
     """
@@ -12,33 +15,84 @@ class SelfInspector:
     callable, with the instance bound to it.
     """
 
+    __slots__ = ()
+
+    _callable_kinds: Mapping[Any, str] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Walking the MRO backwards lets subclasses override the members of their bases
+        members = dict()
+        for klass in reversed(cls.__mro__):
+            members.update(vars(klass))
+
+        cls._callable_kinds = {
+            member: kind
+            for member in members.values()
+            if (kind := _kind_of(member)) is not None
+        }
+
     def resolve_callable(self, callable: AnyCallable) -> AnyCallable:
         if self.is_instance_method(callable):
-            return partial(callable, self)
-        elif self.is_class_method(callable):
-            return partial(callable.__func__, self.__class__)
-        elif self.is_static_method(callable):
+            return MethodType(callable, self)
+
+        return self.resolve_class_callable(callable)
+
+    @classmethod
+    def resolve_class_callable(cls, callable: AnyCallable) -> AnyCallable:
+        """
+        Resolves the callables that don't need an instance of the class (class and
+        static methods); instance methods are returned as they are.
+        """
+        kind = cls.callable_kind(callable)
+        if kind == CLASS_METHOD:
+            return MethodType(callable.__func__, cls)
+        elif kind == STATIC_METHOD:
             return callable.__func__
 
         return callable
 
+    @staticmethod
+    def is_callable_entry(entry: Any) -> bool:
+        """Checks if a definition entry is a callable or an unbound class method."""
+        return callable(entry) or isinstance(entry, classmethod)
+
+    @classmethod
+    def binds_instance_methods(cls, entries: Iterable[Any]) -> bool:
+        """Checks if any of the entries, or any element of a tuple entry, is an instance method."""
+        return any(
+            cls.is_instance_method(element)
+            for entry in entries
+            for element in (entry if isinstance(entry, tuple) else (entry,))
+        )
+
+    @classmethod
+    def callable_kind(cls, callable: Any) -> str | None:
+        """Returns the kind of method of the class that the callable is, if any."""
+        try:
+            return cls._callable_kinds.get(callable)
+        except TypeError:  # Unhashable objects can't be methods of the class
+            return None
+
     @classmethod
     def is_instance_method(cls, callable: AnyCallable) -> bool:
-        functions = [
-            function for _, function in inspect.getmembers(cls, inspect.isfunction)
-        ]
-        return callable in functions
+        return cls.callable_kind(callable) == INSTANCE_METHOD
 
     @classmethod
     def is_class_method(cls, callable: AnyCallable) -> bool:
-        methods = [
-            method.__func__ for _, method in inspect.getmembers(cls, inspect.ismethod)
-        ]
-        return isinstance(callable, classmethod) and callable.__func__ in methods
+        return cls.callable_kind(callable) == CLASS_METHOD
 
     @classmethod
     def is_static_method(cls, callable: AnyCallable) -> bool:
-        functions = [
-            function for _, function in inspect.getmembers(cls, inspect.isfunction)
-        ]
-        return isinstance(callable, staticmethod) and callable.__func__ in functions
+        return cls.callable_kind(callable) == STATIC_METHOD
+
+
+def _kind_of(member: Any) -> str | None:
+    if isinstance(member, FunctionType):
+        return INSTANCE_METHOD
+    if isinstance(member, classmethod):
+        return CLASS_METHOD
+    if isinstance(member, staticmethod):
+        return STATIC_METHOD
+
+    return None
@@ -0,0 +1,97 @@
+from typing import Any, Callable, Iterable, Mapping
+
+from py_transmuter.self_inspector import AnyCallable, SelfInspector
+
+
+class Transmuter(SelfInspector):
+    """
+    Base class of mappers and aggregators, which hold their context and the plan
+    compiled from their definition.
+
+    The definition is validated and compiled once, when the class is defined, and
+    shared by all of its instances, so it must not be modified afterwards. Definitions
+    that use instance methods are compiled for each instance instead.
+    Instances only hold their context and compiled plan in slots; subclasses can
+    declare `__slots__ = ()` so that their instances don't get a `__dict__` either.
+
+    Subclasses define `assert_is_valid_definition`, `definition_entries` and
+    `compile_plan`.
+    """
+
+    context: Mapping[str, Any] | None
+
+    __slots__ = ("context", "_plan")
+
+    _class_plan: Any = None
+    _definition_error: str | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Validated once per class, the error is raised when trying to instantiate it
+        try:
+            cls.assert_is_valid_definition()
+        except ValueError as error:
+            cls._definition_error = str(error)
+        else:
+            cls._definition_error = None
+
+        # Instance methods can only be bound once there is an instance to bind them to
+        cls._class_plan = (
+            None
+            if cls._definition_error is not None
+            or cls.binds_instance_methods(cls.definition_entries())
+            else cls.compile_class_plan()
+        )
+
+    def __init__(self, context: Mapping[str, Any] | None = None) -> None:
+        if self._definition_error is not None:
+            raise ValueError(self._definition_error)
+
+        self.context = context
+        self._plan = self.instance_plan()
+
+    def __getstate__(self) -> tuple[Mapping[str, Any] | None, dict[str, Any] | None]:
+        # Compiled plans hold lambdas, which can't be pickled, so they are rebuilt instead
+        return self.context, getattr(self, "__dict__", None)
+
+    def __setstate__(
+        self, state: tuple[Mapping[str, Any] | None, dict[str, Any] | None]
+    ) -> None:
+        context, attributes = state
+        if attributes:
+            self.__dict__.update(attributes)
+
+        self.context = context
+        self._plan = self.instance_plan()
+
+    def instance_plan(self) -> Any:
+        """
+        Returns the plan shared by the whole class, or compiles one for this instance
+        if the definition uses instance methods.
+        """
+        return (
+            self._class_plan
+            if self._class_plan is not None
+            else self.compile_plan(self.resolve_callable)
+        )
+
+    @classmethod
+    def compile_class_plan(cls) -> Any:
+        """Compiles the plan shared by the whole class."""
+        return cls.compile_plan(cls.resolve_class_callable)
+
+    @classmethod
+    def compile_plan(
+        cls, resolve_callable: Callable[[AnyCallable], AnyCallable]
+    ) -> Any:
+        raise NotImplementedError
+
+    @classmethod
+    def definition_entries(cls) -> Iterable[Any]:
+        """Returns every entry of the definition that may be a callable."""
+        raise NotImplementedError
+
+    @classmethod
+    def assert_is_valid_definition(cls) -> None:
+        """Raises a `ValueError` if the definition can't be compiled."""
+        raise NotImplementedError
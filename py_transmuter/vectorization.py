@@ -0,0 +1,158 @@
+import sys
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+if TYPE_CHECKING:
+    import numpy as np
+
+AnyCallable = TypeVar("AnyCallable", bound=Callable[..., Any])
+
+_VECTORIZABLE_FLAG = "__transmuter_vectorizable__"
+
+
+def vectorizable(function: AnyCallable) -> AnyCallable:
+    """
+    Marks a field transformation as safe to be called once with a NumPy array holding
+    every value of the field, instead of once per value. The function must return an
+    array (or sequence) of the same length as its input.
+    """
+    setattr(getattr(function, "__func__", function), _VECTORIZABLE_FLAG, True)
+    return function
+
+
+def is_vectorizable(function: Callable[..., Any]) -> bool:
+    return getattr(function, _VECTORIZABLE_FLAG, False)
+
+
+def to_array(values: list[Any]) -> "np.ndarray":
+    # NumPy takes a long time to import, so it is only imported once it's used
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "NumPy is required for vectorized mapping, install it with "
+            "`pip install py-transmuter[numpy]`."
+        )
+    return np.asarray(values)
+
+
+def to_list(values: Any) -> list[Any]:
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+_BUILTIN_REDUCTIONS = {sum: "sum", min: "min", max: "max"}
+
+
+def numpy_reduction(function: Callable[..., Any]) -> str | None:
+    """
+    Returns the name of the NumPy reduction equivalent to `function` (builtin or NumPy
+    sums, minimums, maximums and means), or None if there is none or NumPy is not
+    installed.
+    """
+    try:
+        reduction = _BUILTIN_REDUCTIONS.get(function)
+        # A NumPy function can only be passed if NumPy was already imported
+        if reduction is None and "numpy" in sys.modules:
+            reduction = _numpy_reductions().get(function)
+    except TypeError:  # Unhashable callables can't be one of them
+        return None
+
+    # Builtin reductions are also batched with NumPy, which may not be installed
+    return reduction if reduction and find_spec("numpy") is not None else None
+
+
+def _numpy_reductions() -> dict[Callable[..., Any], str]:
+    import numpy as np
+
+    return {
+        np.sum: "np.sum",
+        np.min: "np.min",
+        np.max: "np.max",
+        np.amin: "np.min",
+        np.amax: "np.max",
+        np.mean: "np.mean",
+    }
+
+
+def reduce_groups_at(
+    reduction: str,
+    function: Callable[[list[Any]], Any],
+    values: list[Any],
+    offsets: list[int],
+) -> list[Any]:
+    """
+    Applies a reduction found by `numpy_reduction` to every group of `values`, where
+    the group `i` is the slice between `offsets[i]` and `offsets[i + 1]`, with a single
+    `reduceat` call over all of them. When NumPy can't reduce the values the same way,
+    `function` is called once per group instead.
+    """
+    import numpy as np
+
+    array = _to_numeric_array(values)
+    if array is None or not _reduces_like_function(reduction, array):
+        return [function(values[start:end]) for start, end in zip(offsets, offsets[1:])]
+
+    starts = offsets[:-1]
+    if reduction == "np.mean":
+        sums = np.add.reduceat(array, starts, dtype=np.float64)
+        results = sums / np.diff(offsets)
+    elif reduction in ("sum", "np.sum"):
+        # Adding booleans with NumPy is a logical or, they have to be counted instead
+        array = array.astype(np.int64) if array.dtype.kind == "b" else array
+        results = np.add.reduceat(array, starts)
+    elif reduction in ("min", "np.min"):
+        results = np.minimum.reduceat(array, starts)
+    else:
+        results = np.maximum.reduceat(array, starts)
+
+    # NumPy reductions return NumPy scalars, builtin ones return Python numbers
+    return list(results) if reduction.startswith("np.") else results.tolist()
+
+
+_NUMERIC_KINDS = {bool: "b", int: "i", float: "f"}
+
+
+def _to_numeric_array(values: list[Any]) -> "np.ndarray | None":
+    """
+    Converts the values to a NumPy array only if all of them are of the same numeric
+    type and NumPy keeps that type (ints beyond int64 don't), so that reducing the array
+    gives the same values, of the same type, as reducing each group. Returns None
+    otherwise.
+    """
+    import numpy as np
+
+    value_types = set(map(type, values))
+    if len(value_types) != 1:
+        return None
+
+    kind = _NUMERIC_KINDS.get(value_types.pop())
+    if kind is None:
+        return None
+
+    try:
+        array = np.asarray(values)
+    except (OverflowError, ValueError):
+        return None
+
+    return array if array.dtype.kind == kind else None
+
+
+def _reduces_like_function(reduction: str, array: "np.ndarray") -> bool:
+    """
+    Checks that reducing the array with NumPy gives the results of the original
+    function. `reduceat` adds the values one after another while `np.sum` and `np.mean`
+    use pairwise summation, so sums and means are only batched when every partial sum
+    is exact: integers that can't overflow (or, for means, lose precision as floats).
+    Minimums and maximums of builtin functions also need values without NaNs.
+    """
+    import numpy as np
+
+    if reduction in ("min", "max"):
+        return array.dtype.kind != "f" or not np.isnan(array).any()
+    if reduction in ("np.min", "np.max"):
+        return True
+    if array.dtype.kind == "f":
+        return False
+
+    limit = 2**53 if reduction == "np.mean" else 2**63
+    return float(np.abs(array).max()) * len(array) < limit
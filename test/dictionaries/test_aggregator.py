@@ -2,7 +2,7 @@ from datetime import date, datetime, timedelta
 from statistics import mean
 from typing import Any
 
-from pytest import raises
+from pytest import importorskip, raises
 from py_transmuter.dictionaries.aggregator import DictionaryAggregator
 
 
@@ -167,6 +167,43 @@ def test_aggregator_with_sort_by_extractor_and_field():
     ]
 
 
+def test_aggregator_with_grouping_and_sorting():
+    class Aggregator(DictionaryAggregator):
+        group_by = ("parent",)
+        sort_by = ("age",)
+
+        mappings = {"ages": "age"}
+
+    assert Aggregator().aggregate(
+        [
+            {"parent": "Anna", "age": 3},
+            {"parent": "Tom", "age": 5},
+            {"parent": "Tom", "age": 1},
+            {"parent": "Anna", "age": 2},
+        ]
+    ) == [{"ages": [1, 5]}, {"ages": [2, 3]}]
+
+
+def test_aggregate_iter_with_grouping_prefix_of_sorting():
+    class Aggregator(DictionaryAggregator):
+        group_by = ("parent",)
+        sort_by = ("parent", "age")
+
+        mappings = {"ages": "age"}
+
+    aggregated = Aggregator().aggregate_iter(
+        [
+            {"parent": "Tom", "age": 5},
+            {"parent": "Anna", "age": 3},
+            {"parent": "Tom", "age": 1},
+            {"parent": "Anna", "age": 2},
+        ]
+    )
+
+    assert next(aggregated) == {"ages": [2, 3]}
+    assert list(aggregated) == [{"ages": [1, 5]}]
+
+
 def test_aggregator_with_field_mapper_aggregations():
     def aggregate_values(values: list[float]) -> float:
         average = sum(values) / len(values)
@@ -182,6 +219,165 @@ def test_aggregator_with_field_mapper_aggregations():
     ]
 
 
+def test_aggregator_with_numba_aggregations():
+    importorskip("numba")
+    from py_transmuter.jit import numba_agg
+
+    @numba_agg
+    def total(values):
+        return values.sum()
+
+    class Aggregator(DictionaryAggregator):
+        group_by = ("machine",)
+
+        aggregations = {
+            "machine": ("machine", lambda machines: machines[0]),
+            "total": ("value", total),
+        }
+
+    data = [
+        {"machine": "A", "value": 1.5},
+        {"machine": "B", "value": 10.0},
+        {"machine": "A", "value": 2.5},
+    ]
+
+    assert Aggregator().aggregate(data) == [
+        {"machine": "A", "total": 4.0},
+        {"machine": "B", "total": 10.0},
+    ]
+    assert list(Aggregator().aggregate_iter(data)) == Aggregator().aggregate(data)
+
+
+def test_aggregator_with_numpy_reductions():
+    np = importorskip("numpy")
+
+    class Aggregator(DictionaryAggregator):
+        group_by = ("machine",)
+
+        aggregations = {
+            "machine": ("machine", min),
+            "count": ("value", sum),
+            "lowest": ("value", min),
+            "highest": ("value", max),
+            "average": ("value", np.mean),
+            "total_weight": ("weight", sum),
+            "is_active": ("active", sum),
+        }
+
+    data = [
+        {"machine": "A", "value": 1, "weight": 0.1, "active": True},
+        {"machine": "B", "value": 10, "weight": 0.2, "active": False},
+        {"machine": "A", "value": 4, "weight": 0.7, "active": True},
+    ]
+
+    assert Aggregator().aggregate(data) == [
+        {
+            "machine": "A",
+            "count": 5,
+            "lowest": 1,
+            "highest": 4,
+            "average": 2.5,
+            "total_weight": 0.1 + 0.7,
+            "is_active": 2,
+        },
+        {
+            "machine": "B",
+            "count": 10,
+            "lowest": 10,
+            "highest": 10,
+            "average": 10.0,
+            "total_weight": 0.2,
+            "is_active": 0,
+        },
+    ]
+    assert list(Aggregator().aggregate_iter(data)) == Aggregator().aggregate(data)
+
+
+def test_aggregator_with_numpy_reductions_over_floats():
+    np = importorskip("numpy")
+
+    class Aggregator(DictionaryAggregator):
+        group_by = ("machine",)
+
+        aggregations = {
+            "total": ("value", np.sum),
+            "average": ("value", np.mean),
+            "lowest": ("value", np.min),
+            "count": ("active", np.sum),
+        }
+
+    random = np.random.default_rng(0)
+    data = [
+        {"machine": index % 2, "value": value, "active": value > 0.5}
+        for index, value in enumerate(random.random(20_000).tolist())
+    ]
+
+    result = Aggregator().aggregate(data)
+
+    assert result == list(Aggregator().aggregate_iter(data))
+    assert [list(map(type, fields.values())) for fields in result] == [
+        [np.float64, np.float64, np.float64, np.int64]
+    ] * 2
+
+
+def test_aggregator_with_numpy_reductions_keeps_field_order():
+    importorskip("numpy")
+
+    class Aggregator(DictionaryAggregator):
+        aggregations = {"n": len, "sb": ("b", sum), "mb": ("b", max)}
+
+    data = [{"b": 1}, {"b": 2}]
+
+    result = Aggregator().aggregate(data)
+
+    assert result == [{"n": 2, "sb": 3, "mb": 2}]
+    assert list(result[0]) == ["n", "sb", "mb"]
+    assert list(map(list, Aggregator().aggregate_iter(data))) == [["n", "sb", "mb"]]
+
+
+def test_aggregator_with_reductions_over_mixed_values():
+    importorskip("numpy")
+
+    class Aggregator(DictionaryAggregator):
+        group_by = ("machine",)
+
+        aggregations = {
+            "lowest": ("value", min),
+            "highest": ("value", max),
+            "longest": ("tags", max),
+        }
+
+    data = [
+        {"machine": "A", "value": 2**53 + 1, "tags": [1, 2]},
+        {"machine": "A", "value": 0.5, "tags": [3]},
+        {"machine": "B", "value": 1, "tags": [1]},
+        {"machine": "B", "value": 2.5, "tags": [0, 1, 2]},
+    ]
+
+    result = Aggregator().aggregate(data)
+
+    assert result == [
+        {"lowest": 0.5, "highest": 2**53 + 1, "longest": [3]},
+        {"lowest": 1, "highest": 2.5, "longest": [1]},
+    ]
+    assert type(result[0]["highest"]) is int
+    assert type(result[1]["lowest"]) is int
+    assert list(Aggregator().aggregate_iter(data)) == result
+
+
+def test_aggregator_with_reductions_over_large_integers():
+    importorskip("numpy")
+
+    class Aggregator(DictionaryAggregator):
+        aggregations = {"total": ("value", sum), "highest": ("value", max)}
+
+    data = [{"value": 2**64}, {"value": 2**53 + 1}]
+
+    assert Aggregator().aggregate(data) == [
+        {"total": 2**64 + 2**53 + 1, "highest": 2**64}
+    ]
+
+
 def test_aggregator_with_extractor_aggregations():
     def average_coordinates(turbines: list[dict[Any, Any]]) -> dict[Any, Any]:
         return {
@@ -219,6 +415,35 @@ def test_aggregator_with_mappings_and_aggregations():
     ) == [{"id": 1, "values": [10, 20]}, {"id": 2, "values": [30]}]
 
 
+def test_aggregator_with_many_plain_mappings():
+    class Aggregator(DictionaryAggregator):
+        mappings = {"values": "value", "names": "name"}
+
+    assert Aggregator().aggregate(
+        [{"value": 10, "name": "a"}, {"value": 20, "name": "b"}]
+    ) == [{"values": [10, 20], "names": ["a", "b"]}]
+    assert Aggregator().aggregate([]) == [{"values": [], "names": []}]
+
+
+def test_aggregator_with_context_and_self_inspection():
+    class Aggregator(DictionaryAggregator):
+        FACTOR = 10
+
+        def scale(self, values: list[int]) -> list[int]:
+            return [value * self.context["factor"] for value in values]
+
+        @classmethod
+        def offset(cls, data: dict[Any, Any]) -> int:
+            return data["id"] + cls.FACTOR
+
+        mappings = {"offsets": offset}
+        aggregations = {"values": ("id", scale)}
+
+    assert Aggregator(context={"factor": 2}).aggregate([{"id": 1}, {"id": 2}]) == [
+        {"values": [2, 4], "offsets": [11, 12]}
+    ]
+
+
 def test_aggregator_with_overlapping_mappings_and_aggregations_fails_to_create():
     class Aggregator(DictionaryAggregator):
         mappings = {"id": "parent_id"}
@@ -235,3 +460,34 @@ def test_aggregator_without_mappings_or_aggregations_fails_to_create():
 
     with raises(ValueError):
         Aggregator()
+
+
+def test_aggregator_with_slots():
+    class Aggregator(DictionaryAggregator):
+        __slots__ = ()
+
+        group_by = ("id",)
+        aggregations = {"id": ("id", min)}
+
+    aggregator = Aggregator()
+
+    assert not hasattr(aggregator, "__dict__")
+    assert aggregator.context is None
+    assert aggregator.aggregate([{"id": 1}, {"id": 1}]) == [{"id": 1}]
+
+
+class TotalAggregator(DictionaryAggregator):
+    group_by = ("machine",)
+
+    aggregations = {
+        "machine": ("machine", min),
+        "total": ("value", sum),
+        "values": ("value", list),
+    }
+
+
+def test_aggregate_in_processes():
+    data = [{"machine": id % 3, "value": id} for id in range(10)]
+    aggregator = TotalAggregator()
+
+    assert aggregator.aggregate(data, n_workers=2) == aggregator.aggregate(data)
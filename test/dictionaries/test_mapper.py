@@ -1,7 +1,7 @@
 from datetime import date
 from typing import Any
 
-from pytest import raises
+from pytest import importorskip, raises
 from py_transmuter.dictionaries.mapper import DictionaryMapper
 
 
@@ -102,3 +102,89 @@ def test_map_with_any_type_keys():
         "id": "an_id",
         ("march", 14): "Tomorrow is Pi day!",
     }
+
+
+def test_map_list_with_field_names():
+    class Mapper(DictionaryMapper):
+        mapping = {"identifier": "id", "full_name": "name"}
+
+    data = [{"id": 1, "name": "John"}, {"id": 2, "name": "Jane"}]
+
+    assert Mapper().map_list(data) == [
+        {"identifier": 1, "full_name": "John"},
+        {"identifier": 2, "full_name": "Jane"},
+    ]
+
+
+def test_map_with_mixed_mappings_keeps_order():
+    class Mapper(DictionaryMapper):
+        mapping = {
+            "id": ("id", str),
+            "name": "name",
+            "upper_name": lambda data: data["name"].upper(),
+            "age": "age",
+        }
+
+    mapped = Mapper().map({"id": 1, "name": "John", "age": 30})
+
+    assert mapped == {"id": "1", "name": "John", "upper_name": "JOHN", "age": 30}
+    assert list(mapped.keys()) == ["id", "name", "upper_name", "age"]
+
+
+def test_mapper_instances_share_the_class_plan():
+    class Mapper(DictionaryMapper):
+        mapping = {"id": ("id", str), "name": "name"}
+
+    first_mapper, second_mapper = Mapper(), Mapper({"key": "value"})
+
+    assert first_mapper._plan is second_mapper._plan
+    assert second_mapper.map({"id": 1, "name": "John"}) == {"id": "1", "name": "John"}
+
+
+def test_mapper_with_slots():
+    class Mapper(DictionaryMapper):
+        __slots__ = ()
+
+        mapping = {"id": "id"}
+
+    mapper = Mapper()
+
+    assert not hasattr(mapper, "__dict__")
+    assert mapper.context is None
+    assert mapper.map({"id": 1}) == {"id": 1}
+
+
+def test_map_bytes_list():
+    importorskip("orjson")
+
+    class Mapper(DictionaryMapper):
+        mapping = {"full_name": "name", "id": ("id", str)}
+
+    assert Mapper().map_bytes_list(b'[{"name": "John", "id": 1}]') == (
+        b'[{"full_name":"John","id":"1"}]'
+    )
+
+
+def test_map_bytes_list_with_any_type_keys():
+    importorskip("orjson")
+
+    class Mapper(DictionaryMapper):
+        mapping = {1: "id", date(2021, 3, 14): "name"}
+
+    assert Mapper().map_bytes_list(b'[{"name": "John", "id": 1}]') == (
+        b'[{"1":1,"2021-03-14":"John"}]'
+    )
+
+
+class ScalingMapper(DictionaryMapper):
+    def scale(self, value: int) -> int:
+        return value * self.context["factor"]
+
+    mapping = {"id": "id", "value": ("value", scale)}
+
+
+def test_map_list_in_processes():
+    data = [{"id": id, "value": id * 10} for id in range(10)]
+    mapper = ScalingMapper(context={"factor": 2})
+
+    assert mapper.map_list(data, n_workers=2) == mapper.map_list(data)
@@ -3,7 +3,7 @@ from datetime import date, datetime, timedelta
 from statistics import mean
 from pydantic import BaseModel
 from pydantic.dataclasses import dataclass as py_dataclass
-from pytest import raises
+from pytest import importorskip, raises
 from py_transmuter.models.aggregator import ModelAggregator
 
 
@@ -263,6 +263,57 @@ def test_aggregator_with_sort_by_extractor_and_field():
     ]
 
 
+def test_aggregator_with_grouping_and_sorting():
+    class Child(BaseModel):
+        parent: str
+        age: int
+
+    class Parent(BaseModel):
+        ages: list[int]
+
+    class ChildParentAggregator(ModelAggregator[Parent, Child]):
+        group_by = ("parent",)
+        sort_by = ("age",)
+
+        mappings = {"ages": "age"}
+
+    assert ChildParentAggregator().aggregate(
+        [
+            Child(parent="Anna", age=3),
+            Child(parent="Tom", age=5),
+            Child(parent="Tom", age=1),
+            Child(parent="Anna", age=2),
+        ]
+    ) == [Parent(ages=[1, 5]), Parent(ages=[2, 3])]
+
+
+def test_aggregate_iter_with_grouping_prefix_of_sorting():
+    class Child(BaseModel):
+        parent: str
+        age: int
+
+    class Parent(BaseModel):
+        ages: list[int]
+
+    class ChildParentAggregator(ModelAggregator[Parent, Child]):
+        group_by = ("parent",)
+        sort_by = ("parent", "age")
+
+        mappings = {"ages": "age"}
+
+    aggregated = ChildParentAggregator().aggregate_iter(
+        [
+            Child(parent="Tom", age=5),
+            Child(parent="Anna", age=3),
+            Child(parent="Tom", age=1),
+            Child(parent="Anna", age=2),
+        ]
+    )
+
+    assert next(aggregated) == Parent(ages=[2, 3])
+    assert list(aggregated) == [Parent(ages=[1, 5])]
+
+
 def test_aggregator_with_field_mapper_aggregations():
     class Vertical(BaseModel):
         value: float
@@ -316,6 +367,85 @@ def test_aggregator_with_extractor_aggregations():
     ) == [Park(location=Coordinates(latitude=15, longitude=5))]
 
 
+def test_aggregator_with_numba_aggregations():
+    importorskip("numba")
+    from py_transmuter.jit import numba_agg
+
+    class Measurement(BaseModel):
+        machine: str
+        value: float
+
+    class MachineTotal(BaseModel):
+        machine: str
+        total: float
+
+    @numba_agg
+    def total(values):
+        return values.sum()
+
+    class MachineTotalAggregator(ModelAggregator[MachineTotal, Measurement]):
+        group_by = ("machine",)
+
+        aggregations = {
+            "machine": ("machine", lambda machines: machines[0]),
+            "total": ("value", total),
+        }
+
+    data = [
+        Measurement(machine="A", value=1.5),
+        Measurement(machine="B", value=10),
+        Measurement(machine="A", value=2.5),
+    ]
+
+    assert MachineTotalAggregator().aggregate(data) == [
+        MachineTotal(machine="A", total=4),
+        MachineTotal(machine="B", total=10),
+    ]
+    assert list(MachineTotalAggregator().aggregate_iter(data)) == (
+        MachineTotalAggregator().aggregate(data)
+    )
+
+
+def test_aggregator_with_numpy_reductions():
+    np = importorskip("numpy")
+
+    class Measurement(BaseModel):
+        machine: str
+        value: int
+
+    class MachineSummary(BaseModel):
+        machine: str
+        total: int
+        lowest: int
+        highest: int
+        average: float
+
+    class MachineSummaryAggregator(ModelAggregator[MachineSummary, Measurement]):
+        group_by = ("machine",)
+
+        aggregations = {
+            "machine": ("machine", min),
+            "total": ("value", sum),
+            "lowest": ("value", np.min),
+            "highest": ("value", max),
+            "average": ("value", np.mean),
+        }
+
+    data = [
+        Measurement(machine="A", value=1),
+        Measurement(machine="B", value=10),
+        Measurement(machine="A", value=4),
+    ]
+
+    assert MachineSummaryAggregator().aggregate(data) == [
+        MachineSummary(machine="A", total=5, lowest=1, highest=4, average=2.5),
+        MachineSummary(machine="B", total=10, lowest=10, highest=10, average=10),
+    ]
+    assert list(MachineSummaryAggregator().aggregate_iter(data)) == (
+        MachineSummaryAggregator().aggregate(data)
+    )
+
+
 def test_aggregator_with_mappings_and_aggregations():
     class A(BaseModel):
         parent_id: int
@@ -336,6 +466,32 @@ def test_aggregator_with_mappings_and_aggregations():
     ) == [B(id=1, values=[10, 20]), B(id=2, values=[30])]
 
 
+def test_aggregator_with_context_and_self_inspection():
+    class A(BaseModel):
+        id: int
+
+    class B(BaseModel):
+        values: list[int]
+        offsets: list[int]
+
+    class ABAggregator(ModelAggregator[B, A]):
+        FACTOR = 10
+
+        def scale(self, values: list[int]) -> list[int]:
+            return [value * self.context["factor"] for value in values]
+
+        @classmethod
+        def offset(cls, data: A) -> int:
+            return data.id + cls.FACTOR
+
+        mappings = {"offsets": offset}
+        aggregations = {"values": ("id", scale)}
+
+    assert ABAggregator(context={"factor": 2}).aggregate([A(id=1), A(id=2)]) == [
+        B(values=[2, 4], offsets=[11, 12])
+    ]
+
+
 def test_aggregator_with_overlapping_mappings_and_aggregations_fails_to_create():
     class A(BaseModel):
         parent_id: int
@@ -394,4 +550,49 @@ def test_aggregator_with_extra_fields():
         aggregations = {"id": "id", "values": "value"}
 
     with raises(ValueError):
-        ABAggregator()
\ No newline at end of file
+        ABAggregator()
+
+
+def test_aggregator_skipping_validation():
+    class A(BaseModel):
+        id: int
+
+    class B(BaseModel):
+        id: int
+
+    class ValidatingAggregator(ModelAggregator[B, A]):
+        group_by = ("id",)
+        aggregations = {"id": ("id", lambda ids: str(ids[0]))}
+
+    class NonValidatingAggregator(ModelAggregator[B, A]):
+        skip_validation = True
+
+        group_by = ("id",)
+        aggregations = {"id": ("id", lambda ids: str(ids[0]))}
+
+    assert ValidatingAggregator().aggregate([A(id=1)])[0].id == 1
+    assert NonValidatingAggregator().aggregate([A(id=1)])[0].id == "1"
+
+
+class Measurement(BaseModel):
+    machine: int
+    value: int
+
+
+class MachineValues(BaseModel):
+    machine: int
+    values: list[int]
+
+
+class MachineValuesAggregator(ModelAggregator[MachineValues, Measurement]):
+    group_by = ("machine",)
+
+    aggregations = {"machine": ("machine", min)}
+    mappings = {"values": "value"}
+
+
+def test_aggregate_in_processes():
+    data = [Measurement(machine=id % 3, value=id) for id in range(10)]
+    aggregator = MachineValuesAggregator()
+
+    assert aggregator.aggregate(data, n_workers=2) == aggregator.aggregate(data)
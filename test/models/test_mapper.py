@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Callable
 from pydantic import BaseModel
 from pydantic.dataclasses import dataclass as py_dataclass
-from pytest import raises
+from pytest import importorskip, raises
 from py_transmuter.models.mapper import ModelMapper
+from py_transmuter.vectorization import vectorizable
 
 
 def test_map_with_field_name():
@@ -168,6 +170,38 @@ def test_map_missing_required_field_fails():
         ABMapper()
 
 
+def test_map_missing_required_optional_field_fails():
+    class A(BaseModel):
+        id: int
+
+    class B(BaseModel):
+        id: int
+        name: str | None
+
+    class ABMapper(ModelMapper[B, A]):
+        mapping = {"id": "id"}
+
+    with raises(ValueError):
+        ABMapper()
+
+
+def test_map_missing_required_callable_field_of_dataclass_fails():
+    @dataclass
+    class A:
+        id: int
+
+    @dataclass
+    class B:
+        id: int
+        callback: Callable[[int], None]
+
+    class ABMapper(ModelMapper[B, A]):
+        mapping = {"id": "id"}
+
+    with raises(ValueError):
+        ABMapper()
+
+
 def test_map_extra_field_fails():
     class A(BaseModel):
         id: int
@@ -244,3 +278,172 @@ def test_map_complex_models():
         humidity_proportion=0.5,
         timestamp=datetime(2021, 1, 1, 12),
     )
+
+
+def test_map_skipping_validation():
+    class A(BaseModel):
+        id: int
+
+    class B(BaseModel):
+        id: int
+
+    class ValidatingMapper(ModelMapper[B, A]):
+        mapping = {"id": ("id", str)}
+
+    class NonValidatingMapper(ModelMapper[B, A]):
+        skip_validation = True
+
+        mapping = {"id": ("id", str)}
+
+    assert ValidatingMapper().map(A(id=1)).id == 1
+    assert NonValidatingMapper().map(A(id=1)).id == "1"
+
+
+def test_map_list_vectorized():
+    numpy = importorskip("numpy")
+
+    class A(BaseModel):
+        id: int
+        celsius: float
+
+    class B(BaseModel):
+        id: int
+        fahrenheit: float
+        label: str
+
+    calls = []
+
+    @vectorizable
+    def celsius_to_fahrenheit(celsius):
+        calls.append(celsius)
+        return celsius * 9 / 5 + 32
+
+    class ABMapper(ModelMapper[B, A]):
+        mapping = {
+            "id": "id",
+            "fahrenheit": ("celsius", celsius_to_fahrenheit),
+            "label": lambda data: f"#{data.id}",
+        }
+
+    data = [A(id=1, celsius=0), A(id=2, celsius=100)]
+
+    assert ABMapper().map_list_vectorized(data) == ABMapper().map_list(data)
+    assert ABMapper().map_list_vectorized(data) == [
+        B(id=1, fahrenheit=32, label="#1"),
+        B(id=2, fahrenheit=212, label="#2"),
+    ]
+    assert isinstance(calls[0], numpy.ndarray)
+
+
+def test_mapper_definition_is_validated_once_per_class():
+    class A(BaseModel):
+        a: int
+
+    class B(BaseModel):
+        b: int
+
+    class InvalidMapper(ModelMapper[B, A]):
+        mapping = {}
+
+    assert InvalidMapper._definition_error is not None
+    with raises(ValueError):
+        InvalidMapper()
+    with raises(ValueError):
+        InvalidMapper()
+
+
+def test_map_list_with_plain_and_mixed_fields():
+    class A(BaseModel):
+        id: int
+        name: str
+
+    class B(BaseModel):
+        identifier: int
+        full_name: str
+
+    class PlainMapper(ModelMapper[B, A]):
+        mapping = {"identifier": "id", "full_name": "name"}
+
+    class MixedMapper(ModelMapper[B, A]):
+        mapping = {"identifier": "id", "full_name": ("name", str.upper)}
+
+    data = [A(id=1, name="John"), A(id=2, name="Jane")]
+
+    assert PlainMapper().map_list(data) == [
+        B(identifier=1, full_name="John"),
+        B(identifier=2, full_name="Jane"),
+    ]
+    assert MixedMapper().map_list(data) == [
+        B(identifier=1, full_name="JOHN"),
+        B(identifier=2, full_name="JANE"),
+    ]
+
+
+def test_map_with_nested_fields():
+    class Inner(BaseModel):
+        value: int
+
+    class A(BaseModel):
+        id: int
+        inner: Inner
+
+    class B(BaseModel):
+        id: str
+        value: int
+        double: int
+
+    class ABMapper(ModelMapper[B, A]):
+        mapping = {
+            "id": ("id", str),
+            "value": "inner.value",
+            "double": lambda data: data.inner.value * 2,
+        }
+
+    assert ABMapper().map(A(id=1, inner=Inner(value=5))) == B(
+        id="1", value=5, double=10
+    )
+
+
+def test_map_list_vectorized_without_mappings():
+    class A(BaseModel):
+        id: int
+
+    class B(BaseModel):
+        name: str = "Rodrigo"
+
+    class ABMapper(ModelMapper[B, A]):
+        mapping = {}
+
+    data = [A(id=id) for id in range(5)]
+
+    assert ABMapper().map_list_vectorized(data) == ABMapper().map_list(data)
+    assert ABMapper().map_list_vectorized(data) == [B()] * 5
+
+
+def test_map_list_vectorized_with_numeric_transformations():
+    importorskip("numba")
+    from py_transmuter.jit import numeric
+
+    class A(BaseModel):
+        id: int
+        celsius: float
+
+    class B(BaseModel):
+        id: int
+        fahrenheit: float
+
+    @numeric
+    def celsius_to_fahrenheit(celsius):
+        return celsius * 9 / 5 + 32
+
+    class ABMapper(ModelMapper[B, A]):
+        mapping = {"id": "id", "fahrenheit": ("celsius", celsius_to_fahrenheit)}
+
+    data = [A(id=1, celsius=0), A(id=2, celsius=100)]
+
+    assert ABMapper().map_list_vectorized(data) == [
+        B(id=1, fahrenheit=32),
+        B(id=2, fahrenheit=212),
+    ]
+    assert ABMapper().map_list(data) == ABMapper().map_list_vectorized(data)
+    assert ABMapper().map(data[0]) == B(id=1, fahrenheit=32)